@@ -1,13 +1,36 @@
 import argparse
-import socket
+import asyncio
+import os
 import re
-from os import path
-from threading import Thread
 import gzip
 
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    # uvloop is a ~2-4x faster drop-in event loop, but the stdlib one works fine
+    uvloop = None
+
+try:
+    # Cython-compiled parser (python setup.py build_ext --inplace)
+    from app.parser import parse_request as _parse_request_c
+except ImportError:
+    _parse_request_c = None
+
 CRLF_DELIMITER = "\r\n"
 HTTP_VERSION = "HTTP/1.1"
 
+# Bodies at least this large are compressed off the event loop, so one
+# big response can't stall every other connection; below it the executor
+# round-trip would cost more than the compression itself.
+LARGE_BODY_THRESHOLD = 64 * 1024
+
+# Canonical header keys, so lookups don't rebuild the key per request.
+HDR_USER_AGENT = b"user-agent"
+HDR_CONTENT_LENGTH = b"content-length"
+HDR_ACCEPT_ENCODING = b"accept-encoding"
+HDR_CONNECTION = b"connection"
+
 
 class RequestContent:
     def __init__(
@@ -17,32 +40,65 @@ class RequestContent:
             path: str,
             http_version: str,
             headers: dict,
-            body: str,
+            body: bytes,
             server_directory: str = None,
     ) -> None:
         self.method = method
         self.path = path
         self.http_version = http_version
+        # Lowercase bytes keys mapped to raw (unsplit) bytes values;
+        # list-valued headers are only split when headers_pair asks
         self.headers = headers
         self.body = body
         # Just use this for task AP6
         self.server_directory = server_directory
 
-    def header(self, key: str) -> str:
-        return ', '.join(self.headers_pair(key))
+    def reset(self, *, method: str, path: str, http_version: str, body: bytes):
+        """
+        Reinitializes in place for the next request on a connection,
+        keeping the headers dict allocation alive across requests.
+        """
+        self.method = method
+        self.path = path
+        self.http_version = http_version
+        self.headers.clear()
+        self.body = body
+        self.server_directory = None
+        return self
+
+    def header(self, key: bytes) -> str:
+        value = self.headers.get(key)
+        if value is None:
+            return ""
+        return value.decode('latin-1')
+
+    def headers_pair(self, key: bytes) -> tuple:
+        """
+        Returns the value tuple of the header with the given key.
+
+        Keys must be canonical lowercase bytes (see the HDR_* constants);
+        the parser already lowercases on insert.
+        """
+        value = self.headers.get(key)
+        if value is None:
+            return ()
+        return tuple(value.split(b", ")) if b", " in value else (value,)
 
-    def headers_pair(self, key: str) -> tuple:
+    def keep_alive(self) -> bool:
         """
-        Returns the key-value pair of the header with the given key.
+        Whether the connection should stay open after this request.
         """
-        return self.headers.get(key.lower()) or ()
+        connection = self.headers.get(HDR_CONNECTION, b"").lower()
+        if self.http_version == "HTTP/1.0":
+            return connection == b"keep-alive"
+        return connection != b"close"
 
     def to_encoded_request(self) -> bytes:
         delimiter = CRLF_DELIMITER.encode()
         headers_line = f"{self.method} {self.path} {self.http_version}"
-        headers = [f"{key}: {', '.join(value)}".encode()
+        headers = [key + b": " + value
                    for key, value in self.headers.items()]
-        if self.body is not bytes:
+        if not isinstance(self.body, (bytes, bytearray)):
             self.body = str(self.body).encode()
 
         return b"".join([
@@ -61,42 +117,139 @@ class RequestContent:
 
 
 class RequestParser():
-    def __init__(self, body: str):
+    """
+    Generic request parser, keeping every header. The server's hot path
+    uses a specialized parser from build_fast_parser instead.
+    """
+
+    def __init__(self, body: bytes):
         self.body = body
 
-    def parse(self) -> RequestContent:
-        headers, body = self.body.split(CRLF_DELIMITER * 2)
-        headers = headers.split(CRLF_DELIMITER)
+    def parse(self, into: RequestContent = None) -> RequestContent:
+        if _parse_request_c is not None:
+            method, url, http_version, headers, body = _parse_request_c(
+                self.body)
+            if into is None:
+                return RequestContent(
+                    method=method, path=url, http_version=http_version,
+                    headers=headers, body=body)
+            into.reset(
+                method=method, path=url, http_version=http_version, body=body)
+            into.headers.update(headers)
+            return into
+
+        head, body = self.body.split(b"\r\n\r\n", 1)
 
         # First line is the request line
-        request_line = headers.pop(0)
-        # Split the request line into method, url and http_version
-        method, url, http_version = request_line.split(" ")
-
-        # Parse the headers
-        headers_dict = {}
-        for header in headers:
-            key, value = header.split(": ", maxsplit=2)
-            headers_dict[key.lower()] = tuple(value.split(", "))
-            # This is RFC 2616 compliant, but we don't need to worry about multiple headers with the same key
-
-        return RequestContent(
-            method=method,
-            path=url,
-            http_version=http_version,
-            headers=headers_dict,
-            body=body
+        request_line, _, header_bytes = head.partition(b"\r\n")
+        # Split the request line into method, url and http_version; only
+        # these small fields are decoded, the rest of the buffer stays bytes
+        method, url, http_version = request_line.split(b" ", 2)
+
+        if into is None:
+            into = RequestContent(
+                method="", path="", http_version="", headers={}, body=b"")
+        into.reset(
+            method=method.decode('ascii'),
+            path=url.decode('ascii'),
+            http_version=http_version.decode('ascii'),
+            body=body,
         )
 
+        # Store raw values: almost no request header is list-valued, so
+        # eagerly splitting on ", " allocated a tuple per header that
+        # nobody ever read. headers_pair splits on demand instead.
+        headers = into.headers
+        for line in header_bytes.split(b"\r\n"):
+            key, _, value = line.partition(b": ")
+            headers[key.lower()] = value
+
+        return into
+
+
+# Pre-rendered status lines for the handful of codes this server emits,
+# so the hot path is a dict lookup instead of an f-string + encode
+STATUS_LINES = {
+    (200, "OK"): b"HTTP/1.1 200 OK",
+    (201, "Created"): b"HTTP/1.1 201 Created",
+    (404, "Not Found"): b"HTTP/1.1 404 Not Found",
+    (405, "Method Not Allowed"): b"HTTP/1.1 405 Method Not Allowed",
+}
+
+# Pre-encoded Content-Length values: typical bodies here are tiny, so
+# the int -> str -> bytes round-trip on every response is a dict probe
+CONTENT_LENGTHS = {n: str(n).encode('ascii') for n in range(4096)}
+
+
+def build_fast_parser(header_keys):
+    """
+    Generates a parser specialized to the given lowercase header keys.
+
+    The emitted function dispatches on the (case-folded) first byte of
+    each header line and only confirms-and-extracts the names the app
+    will actually read; every other header is skipped without slicing
+    out its key or value.
+    """
+    by_first_byte = {}
+    for key in header_keys:
+        by_first_byte.setdefault(key[0] | 32, []).append(key)
+
+    src = [
+        "def parse_fast(buf, into):",
+        "    lines = buf.split(b'\\r\\n')",
+        "    method, url, http_version = lines[0].split(b' ', 2)",
+        "    into.method = method.decode('ascii')",
+        "    into.path = url.decode('ascii')",
+        "    into.http_version = http_version.decode('ascii')",
+        "    into.body = b''",
+        "    into.server_directory = None",
+        "    headers = into.headers",
+        "    headers.clear()",
+        "    for line in lines[1:]:",
+        "        if not line:",
+        "            continue",
+        "        c = line[0] | 32",
+    ]
+    branch = "if"
+    for byte, keys in sorted(by_first_byte.items()):
+        src.append(f"        {branch} c == {byte}:")
+        branch = "elif"
+        for key in keys:
+            prefix = key + b":"
+            src.append(
+                f"            if line[:{len(prefix)}].lower() == {prefix!r}:")
+            src.append(
+                f"                headers[{key!r}] = line[{len(prefix)}:].strip()")
+            src.append("                continue")
+    src.append("    return into")
+
+    namespace = {}
+    exec(compile("\n".join(src), "<specialized-parser>", "exec"), namespace)
+    return namespace["parse_fast"]
+
 
 class ResponseContent:
     VALID_ENCODINGS = ('gzip',)
 
     def __init__(self) -> None:
-        self.headers: dict = {}
-        self.body: str = ""
+        # Insertion-ordered (key, value) pairs, both already ASCII bytes
+        self.headers: list = []
+        self.reset()
+
+    def reset(self):
+        """
+        Returns the response to its freshly-constructed state, keeping
+        the headers list allocation alive so it can be reused.
+        """
+        self.headers.clear()
+        self.headers.append((b"Connection", b"keep-alive"))
+        self.body: bytes = b""
         self.status_code: int = 200
         self.reason_phrase: str = "OK"
+        self._status_line: bytes = STATUS_LINES[(200, "OK")]
+        # Open binary file to stream as the body via sendfile, if any
+        self.file = None
+        return self
 
     @staticmethod
     def not_found():
@@ -110,53 +263,102 @@ class ResponseContent:
             .set_status_code(405, "Method Not Allowed") \
             .set_body("Method Not Allowed")
 
-    def set_header(self, key: str, value: str):
-        return self.set_header_pair(key, (value,))
-
-    def set_header_pair(self, key: str, values: tuple):
-        self.headers[key] = values
+    def set_header(self, key: str | bytes, value: str | bytes):
+        if isinstance(key, str):
+            key = key.encode('ascii')
+        if isinstance(value, str):
+            value = value.encode('ascii')
+        for index, (existing, _) in enumerate(self.headers):
+            if existing == key:
+                self.headers[index] = (key, value)
+                return self
+        self.headers.append((key, value))
         return self
 
+    def set_header_pair(self, key: str | bytes, values: tuple):
+        return self.set_header(key, ", ".join(values))
+
+    def has_header(self, key: str | bytes) -> bool:
+        if isinstance(key, str):
+            key = key.encode('ascii')
+        return any(existing == key for existing, _ in self.headers)
+
     def set_content_type(self, content_type: str):
         return self.set_header("Content-Type", content_type)
 
     def set_status_code(self, status_code: int, reason_phrase: str = "OK"):
         self.status_code = status_code
         self.reason_phrase = reason_phrase
+        self._status_line = STATUS_LINES.get((status_code, reason_phrase)) \
+            or f"{HTTP_VERSION} {status_code} {reason_phrase}".encode('ascii')
         return self
 
-    def set_body(self, body: str):
-        self.body = str(body)
+    def set_body(self, body: bytes | str):
+        # Encode exactly once here; everything downstream works on bytes
+        self.body = body if isinstance(body, bytes) else str(body).encode()
         return self
 
     def set_raw_body(self, body: bytes):
         self.body = body
         return self
 
+    def set_file(self, file, size: int):
+        """
+        Streams an open binary file as the body. The dispatcher hands it
+        to the kernel with sendfile, so the content never enters Python.
+        """
+        self.file = file
+        self.set_content_type('application/octet-stream')
+        self.set_header(
+            b"Content-Length",
+            CONTENT_LENGTHS.get(size) or str(size).encode('ascii'))
+        return self
+
+    def to_encoded_head(self) -> bytes:
+        """
+        Encodes the status line and headers only, for responses whose
+        body is streamed separately.
+        """
+        parts = [self._status_line]
+        parts.extend(key + b": " + value for key, value in self.headers)
+        parts.append(b'')
+        parts.append(b'')
+        return b"\r\n".join(parts)
+
     def to_encoded_response(self) -> bytes:
-        if not isinstance(self.body, (bytes, bytearray)):
-            self.body = str(self.body).encode()
+        body = self.body
 
-        if self.headers.get("Content-Type") is None:
+        if not self.has_header(b"Content-Type"):
             self.set_content_type("text/plain")
-        self.set_header("Content-Length", str(len(self.body)))
-
-        delimiter = CRLF_DELIMITER.encode()
-        status_line = f"{HTTP_VERSION} {self.status_code} {self.reason_phrase}"
-        general_headers = [f"{key}: {', '.join(value)}".encode(
-        ) for key, value in self.headers.items()]
-
-        return delimiter.join([
-            status_line.encode(),
-            *general_headers,
-            b'',
-            self.body,
-        ])
+        # 204/304 responses must not carry a body, so no Content-Length
+        if self.status_code not in (204, 304):
+            length = len(body)
+            self.set_header(
+                b"Content-Length",
+                CONTENT_LENGTHS.get(length) or str(length).encode('ascii'))
+
+        # Everything here is already bytes, so one join is the only
+        # allocation and the body is never transcoded a second time
+        parts = [self._status_line]
+        parts.extend(key + b": " + value for key, value in self.headers)
+        parts.append(b'')
+        parts.append(body)
+        return b"\r\n".join(parts)
 
     def __bytes__(self) -> bytes:
         return self.to_encoded_response()
 
 
+# Fully pre-rendered responses for the dispatcher's miss paths, so a 404
+# or 405 is a single write with no per-request formatting at all
+NOT_FOUND_RESPONSE = bytes(ResponseContent.not_found())
+METHOD_NOT_ALLOWED_RESPONSE = bytes(ResponseContent.method_not_allowed())
+
+# Bytes view of VALID_ENCODINGS for comparing against raw header values
+VALID_ENCODINGS_BYTES = tuple(
+    encoding.encode('ascii') for encoding in ResponseContent.VALID_ENCODINGS)
+
+
 class Route:
     def __init__(self, path: str, callback) -> None:
         """
@@ -167,81 +369,217 @@ class Route:
         """
         self.path = path
         self.callback = callback
-        self.pattern = self._build_pattern()
-        self.args = []
-
-    def match(self, path: str) -> bool:
+        # Templates shaped like /echo/{str} — a literal prefix, one
+        # parameter, nothing after — are matched with startswith + slice;
+        # the regex engine is only involved for anything more complex.
+        simple = re.fullmatch(r"([^{}]+){\w+}", path)
+        self.prefix = simple.group(1) if simple else None
+        self.pattern = None if simple else self._build_pattern()
+
+    def match(self, path: str) -> tuple | None:
         """
         Checks if the given path matches the route.
+
+        Returns the captured path arguments on a match, None otherwise.
         """
-        match = re.match(self.pattern, path)
+        if self.prefix is not None:
+            arg = path[len(self.prefix):]
+            if arg and "/" not in arg and path.startswith(self.prefix):
+                return (arg,)
+            return None
+
+        match = self.pattern.match(path)
         if match:
-            self.args = match.groups()
-            return True
-        return False
+            return match.groups()
+        return None
 
-    def _build_pattern(self):
+    def _build_pattern(self) -> re.Pattern:
         """
-        Builds a regex pattern from the path.
+        Builds a compiled regex pattern from the path, so matching is a
+        single C-level Pattern.match call per request.
         """
-        if self.path == "/":
-            return r"^/$"
-        return re.sub(r"{(\w+)}", r"([^/]+)", self.path)
+        return re.compile("^" + re.sub(r"{(\w+)}", r"([^/]+)", self.path) + "$")
 
 
 class ServerSocket:
     def __init__(self, host: str, port: int):
-        self.socket = socket.create_server((host, port), reuse_port=True)
-        self.router = {
-            "GET": [],
-            "POST": [],
-            "PUT": [],
-            "DELETE": [],
-            # Add more methods if needed
-        }
+        self.host = host
+        self.port = port
+        # Add more methods if needed
+        methods = ("GET", "POST", "PUT", "DELETE")
+        # Literal paths dispatch through a plain dict lookup, simple
+        # prefix/{name} templates through startswith, and only complex
+        # templates fall back to a single compiled alternation per method.
+        self._static = {method: {} for method in methods}
+        self._prefix = {method: [] for method in methods}
+        self._dynamic = {method: [] for method in methods}
+        self._compiled = {method: None for method in methods}
+        # Headers the dispatcher itself reads; routes add theirs via on()
+        # and the specialized parser skips everything else
+        self._wanted_headers = {
+            HDR_CONTENT_LENGTH, HDR_ACCEPT_ENCODING, HDR_CONNECTION}
+        self._parse_fast = None
         self.directory = None
 
     def set_directory(self, directory: str) -> None:
         self.directory = directory
 
-    def on(self, method: str, path: str, callback) -> None:
-        self.router[method.upper()].append(Route(path, callback))
-
-    def run(self) -> None:
-        while True:
-            client, _ = self.socket.accept()
-            thread = Thread(target=self.handle_connection, args=(client,))
-            thread.run()
-            client.close()
-
-    def handle_connection(self, client: socket):
-        while (data := client.recv(2048)) != b'':
-            request = RequestParser(data.decode()).parse()
-            if request.method not in self.router:
-                client.send(bytes(ResponseContent.method_not_allowed()))
-                break
-
-            routes = self.router[request.method]
-            for route in routes:
-                if route.match(request.path):
-                    request.server_directory = self.directory
-                    response: ResponseContent = route.callback(
-                        request, *route.args)
-                    encodings = request.headers_pair('Accept-Encoding')
-                    if any(encoding in ResponseContent.VALID_ENCODINGS for encoding in encodings):
-                        response.set_header_pair(
-                            'Content-Encoding', ResponseContent.VALID_ENCODINGS)
-                        response.set_raw_body(
-                            gzip.compress(response.body.encode())
-                        )
-
-                    client.send(bytes(response))
+    def on(self, method: str, path: str, callback, headers: tuple = ()) -> None:
+        """
+        Registers a route. `headers` declares which request headers the
+        callback reads, so the specialized parser knows to keep them.
+        """
+        self._wanted_headers.update(key.lower() for key in headers)
+        method = method.upper()
+        if "{" not in path:
+            self._static[method][path] = callback
+            return
+
+        route = Route(path, callback)
+        if route.prefix is not None:
+            self._prefix[method].append(route)
+            return
+
+        self._dynamic[method].append(route)
+        self._rebuild_alternation(method)
+
+    def _rebuild_alternation(self, method: str) -> None:
+        """
+        Joins every parameterized route of a method into one alternation,
+        keyed back to its route by the last group the branch can match.
+        """
+        parts = []
+        table = {}
+        group = 1
+        for route in self._dynamic[method]:
+            inner = route.pattern.pattern[1:-1]  # strip the ^...$ anchors
+            parts.append(f"({inner})")
+            n_args = route.pattern.groups
+            # The branch group closes after its inner groups, so
+            # match.lastindex is the branch group itself.
+            table[group] = (group, n_args, route.callback)
+            group += n_args + 1
+
+        pattern = re.compile("^(?:" + "|".join(parts) + ")$")
+        self._compiled[method] = (pattern, table)
+
+    def run(self, workers: int = 1) -> None:
+        # reuse_port lets every worker bind the same (host, port), so the
+        # kernel load-balances accepted connections across the forked
+        # processes — one event loop per core, no shared state needed
+        if workers > 1 and hasattr(os, "fork"):
+            for _ in range(workers - 1):
+                if os.fork() == 0:
                     break
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        # All routes are registered by now, so the parser can be
+        # specialized to exactly the headers this app will read
+        self._parse_fast = build_fast_parser(sorted(self._wanted_headers))
+        server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, reuse_port=True)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # One RequestContent serves every request on this connection:
+        # the parser resets it in place instead of reallocating
+        request = RequestContent(
+            method="", path="", http_version="", headers={}, body=b"")
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil((CRLF_DELIMITER * 2).encode())
+                except (asyncio.IncompleteReadError, ConnectionResetError):
+                    break
+
+                self._parse_fast(head, request)
+                content_length = int(request.header(HDR_CONTENT_LENGTH) or 0)
+                if content_length:
+                    request.body = await reader.readexactly(content_length)
+
+                await self._dispatch(request, writer)
+                if not request.keep_alive():
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionResetError, BrokenPipeError):
+                pass
+
+    def _match(self, method: str, path: str):
+        """
+        Resolves a path to its (callback, args) pair, or None on a miss.
+        """
+        callback = self._static[method].get(path)
+        if callback is not None:
+            return callback, ()
+
+        for route in self._prefix[method]:
+            args = route.match(path)
+            if args is not None:
+                return route.callback, args
+
+        compiled = self._compiled[method]
+        if compiled is None:
+            return None
+        pattern, table = compiled
+        match = pattern.match(path)
+        if match is None:
+            return None
+
+        group, n_args, callback = table[match.lastindex]
+        return callback, match.groups()[group:group + n_args]
+
+    async def _dispatch(self, request: RequestContent, writer: asyncio.StreamWriter) -> None:
+        if request.method not in self._static:
+            writer.write(METHOD_NOT_ALLOWED_RESPONSE)
+            await writer.drain()
+            return
+
+        matched = self._match(request.method, request.path)
+        if matched is None:
+            writer.write(NOT_FOUND_RESPONSE)
+            await writer.drain()
+            return
+
+        callback, args = matched
+        request.server_directory = self.directory
+        response = callback(request, *args)
+        if asyncio.iscoroutine(response):
+            response = await response
+
+        if not request.keep_alive():
+            response.set_header(b"Connection", b"close")
+
+        if response.file is not None:
+            # Headers first, then let the kernel copy the file straight
+            # from page cache into the socket
+            writer.write(response.to_encoded_head())
+            await writer.drain()
+            try:
+                await asyncio.get_running_loop().sendfile(
+                    writer.transport, response.file)
+            finally:
+                response.file.close()
+            return
+
+        encodings = request.headers_pair(HDR_ACCEPT_ENCODING)
+        if any(encoding in VALID_ENCODINGS_BYTES for encoding in encodings):
+            response.set_header_pair(
+                'Content-Encoding', ResponseContent.VALID_ENCODINGS)
+            data = response.body
+            if len(data) >= LARGE_BODY_THRESHOLD:
+                data = await asyncio.get_running_loop().run_in_executor(
+                    None, gzip.compress, data)
             else:
-                client.send(bytes(ResponseContent.not_found()))
+                data = gzip.compress(data)
+            response.set_raw_body(data)
 
-    def close(self):
-        self.socket.close()
+        writer.write(bytes(response))
+        await writer.drain()
 
 
 def index_route(request: RequestContent, *args) -> ResponseContent:
@@ -253,27 +591,30 @@ def echo_route(request: RequestContent, *args) -> ResponseContent:
 
 
 def user_agent_route(request: RequestContent, *args) -> ResponseContent:
+    # Hot route: grab the raw bytes value straight from the headers dict,
+    # skipping the header() decode wrapper — set_body takes bytes as-is
     return ResponseContent() \
-        .set_body(request.header("UsEr-aGeNT"))
+        .set_body(request.headers.get(HDR_USER_AGENT, b""))
 
 
 def file_route(request: RequestContent, *args) -> ResponseContent:
     file_path = f"{request.server_directory}/{args[0]}"
-    # Check if the file exists
-    if not path.exists(file_path):
+    # Open directly and let a miss raise: one syscall instead of an
+    # exists() stat followed by an open, and no TOCTOU window
+    try:
+        file = open(file_path, "rb")
+    except (FileNotFoundError, IsADirectoryError):
         return ResponseContent.not_found()
 
-    with open(file_path, "r") as file:
-        return ResponseContent() \
-            .set_content_type('application/octet-stream') \
-            .set_body(file.read())
+    size = os.fstat(file.fileno()).st_size
+    return ResponseContent().set_file(file, size)
 
 
 def create_file_route(request: RequestContent, *args) -> ResponseContent:
     # The file to create
     file_path = f"{request.server_directory}/{args[0]}"
 
-    with open(file_path, "w") as file:
+    with open(file_path, "wb") as file:
         file.write(request.body)
 
     return ResponseContent() \
@@ -286,18 +627,19 @@ def main():
     parser.add_argument("--directory", type=str, default=None)
     parser.add_argument("--port", type=int, default=4221)
     parser.add_argument("--host", type=str, default="localhost")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
     args = parser.parse_args()
 
     server = ServerSocket(args.host, args.port)
     server.set_directory(args.directory)
 
     server.on("GET", "/echo/{str}", echo_route)
-    server.on("GET", "/user-agent", user_agent_route)
+    server.on("GET", "/user-agent", user_agent_route,
+              headers=(HDR_USER_AGENT,))
     server.on("GET", "/files/{filename}", file_route)
     server.on("POST", "/files/{filename}", create_file_route)
     server.on("GET", "/", index_route)
-    server.run()
-    server.close()
+    server.run(args.workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled request parser.
+
+Optional: build with `python setup.py build_ext --inplace` (requires
+Cython). app.main falls back to the pure Python RequestParser when the
+extension is not present.
+"""
+
+
+cpdef tuple parse_request(bytes buf):
+    """
+    Parses a full request head (and any trailing body bytes) into
+    (method, path, http_version, headers, body). Header keys are
+    lowercase bytes, values raw bytes, matching the Python parser.
+    """
+    cdef Py_ssize_t head_end = buf.find(b"\r\n\r\n")
+    cdef Py_ssize_t line_start, line_end, sep
+    cdef dict headers = {}
+    cdef bytes body, method, url, http_version, rest
+
+    if head_end < 0:
+        raise ValueError("incomplete request head")
+    body = buf[head_end + 4:]
+
+    line_end = buf.find(b"\r\n")
+    method, _, rest = buf[:line_end].partition(b" ")
+    url, _, http_version = rest.partition(b" ")
+
+    line_start = line_end + 2
+    while line_start < head_end:
+        line_end = buf.find(b"\r\n", line_start, head_end)
+        if line_end < 0:
+            line_end = head_end
+        sep = buf.find(b": ", line_start, line_end)
+        if sep >= 0:
+            headers[buf[line_start:sep].lower()] = buf[sep + 2:line_end]
+        line_start = line_end + 2
+
+    return (
+        method.decode('ascii'),
+        url.decode('ascii'),
+        http_version.decode('ascii'),
+        headers,
+        body,
+    )
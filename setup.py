@@ -0,0 +1,15 @@
+"""
+Builds the optional Cython parser extension:
+
+    pip install cython && python setup.py build_ext --inplace
+
+The server runs fine without it; app.main falls back to the pure
+Python parser when app.parser has not been compiled.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="codecrafters-http-server",
+    ext_modules=cythonize("app/parser.pyx"),
+)